@@ -3,7 +3,8 @@
 If the dataset already exists, then its attributes are updated.
 
 Dependencies:
-    $ mamba install ckanapi pyyaml google-cloud-storage requests gdal
+    $ mamba install ckanapi pyyaml google-cloud-storage requests \
+        requests-toolbelt gdal
 
 Note:
     You will need to authenticate with the google cloud api in order to do
@@ -13,18 +14,21 @@ Note:
 
         $ gcloud auth application-default login
 """
-import collections
+import concurrent.futures
 import datetime
+import functools
 import hashlib
 import json
 import logging
 import mimetypes
 import os
-import pprint
 import re
 import sys
+import tempfile
+import time
 import warnings
 
+import ckanapi.common
 import ckanapi.errors
 import pygeoprocessing  # mamba install pygeoprocessing
 import requests  # mamba install requests
@@ -34,14 +38,37 @@ from google.cloud import storage  # mamba install google-cloud-storage
 from osgeo import gdal
 from osgeo import ogr
 from osgeo import osr
+from requests.adapters import HTTPAdapter
+# mamba install requests-toolbelt
+from requests_toolbelt import MultipartEncoder
+
+try:
+    # LibYAML's C parser is far faster than the pure-python one.
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+try:
+    import orjson  # mamba install orjson
+
+    def _json_dumps(obj):
+        # OPT_SERIALIZE_NUMPY handles numpy floats from the bbox transform.
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+except ImportError:
+    _json_dumps = json.dumps
 
-logging.basicConfig(level=logging.DEBUG)
 LOGGER = logging.getLogger(os.path.basename(__file__))
 
 URL = "https://data.naturalcapitalproject.stanford.edu"
 
 MODIFIED_APIKEY = os.environ['CKAN_APIKEY']
 
+LICENSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache')
+LICENSE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+HASH_BLOCK_SIZE = 1 << 20  # read files to hash 1M at a time
+
 RESOURCES_BY_EXTENSION = {
     '.csv': 'CSV Table',
     '.aux.xml': 'GDAL Auxiliary XML',
@@ -59,24 +86,66 @@ for extension, mimetype in [
 
 
 def _hash_file_sha256(filepath):
-    sha256 = hashlib.sha256()
     with open(filepath, 'rb') as f:
+        # hashlib.file_digest (python 3.11+) keeps the read/update loop out
+        # of the interpreter.
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        sha256 = hashlib.sha256()
         while True:
-            data = f.read(2**16)  # read in 64k at a time
+            data = f.read(HASH_BLOCK_SIZE)
             if not data:
                 break
             sha256.update(data)
     return sha256.hexdigest()
 
 
-def _get_created_date(filepath):
-    return datetime.datetime.utcfromtimestamp(
-        os.path.getctime(filepath))
+class _HashingReader:
+    """A read-only file wrapper that computes a SHA-256 digest as it is read.
+
+    This allows a file to be hashed while it is being uploaded, rather than
+    reading it from disk a second time just to compute the hash.  Any other
+    attribute access (``name``, ``close``, ...) is passed through to the
+    wrapped file object.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.sha256.update(data)
+        return data
+
+    def hexdigest(self):
+        return self.sha256.hexdigest()
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
+
+
+def _utc_now_isoformat():
+    """Get the current UTC time as an ISO 8601 string.
+
+    CKAN's date validators do not accept UTC offsets, and CKAN stores its
+    own timestamps as naive UTC, so the offset is left off.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).replace(
+        tzinfo=None).isoformat()
+
+
+def _get_created_date(file_stat):
+    """Get a file's ctime as a UTC datetime from its ``os.stat`` result."""
+    return datetime.datetime.fromtimestamp(
+        file_stat.st_ctime, tz=datetime.timezone.utc)
 
 
 def _create_resource_dict_from_file(
         filepath, description, upload=False, filename=None):
-    now = datetime.datetime.now().isoformat()
+    now = _utc_now_isoformat()
+    file_stat = os.stat(filepath)
 
     if not filename:
         filename = os.path.basename(filepath)
@@ -84,27 +153,77 @@ def _create_resource_dict_from_file(
         'description': description,
         # strip out the `.` from the extension
         'format': os.path.splitext(filepath)[1][1:].upper(),
-        'hash': f"sha256:{_hash_file_sha256(filepath)}",
         'name': filename,
-        'size': os.path.getsize(filepath),
+        'size': file_stat.st_size,
         'created': now,
         'cache_last_updated': now,
         # resource_type appears to just be a string, e.g. api, service,
         # download, etc, and it's user-defined, not an enum
     }
 
-    print(filepath)
+    LOGGER.debug(f"Creating resource from file {filepath}")
     mimetype, _ = mimetypes.guess_type(filepath)
     if mimetype:  # will be None if mimetype unknown
         resource['mimetype'] = mimetype
 
     if upload:
-        resource['upload'] = open(filepath, 'rb')
+        # The hash is computed as the file is uploaded; the resource's hash
+        # is patched in once the upload completes.
+        resource['upload'] = _HashingReader(open(filepath, 'rb'))
+    else:
+        resource['hash'] = f"sha256:{_hash_file_sha256(filepath)}"
     return resource
 
 
+def _upload_resource(catalog, package_id, resource):
+    """Create a CKAN resource, streaming its upload from disk.
+
+    ckanapi builds multipart uploads in memory, which for large files means
+    holding the whole file in RAM.  This encodes the request with
+    ``MultipartEncoder`` instead so the file is read in chunks as it is sent.
+
+    Args:
+        catalog (ckanapi.RemoteCKAN): The CKAN instance to create the
+            resource on.  Its session must already be authorized.
+        package_id (str): The ID of the package to add the resource to.
+        resource (dict): The resource parameters, including the open file to
+            upload under the ``upload`` key.
+
+    Returns:
+        The created resource dict.
+    """
+    upload = resource['upload']
+    fields = {'package_id': package_id}
+    for key, value in resource.items():
+        # Multipart fields must be strings; missing works the same as None.
+        if key != 'upload' and value is not None:
+            fields[key] = str(value)
+    fields['upload'] = (
+        os.path.basename(upload.name), upload,
+        resource.get('mimetype', 'application/octet-stream'))
+
+    encoder = MultipartEncoder(fields=fields)
+    url = f"{catalog.address.rstrip('/')}/api/action/resource_create"
+    # Match the headers and connect timeout that RemoteCKAN.call_action uses,
+    # but don't time out reading the response to a large upload.
+    # REQUEST_TIMEOUT is None or a (connect, read) tuple.
+    connect_timeout = ckanapi.common.REQUEST_TIMEOUT
+    if isinstance(connect_timeout, tuple):
+        connect_timeout = connect_timeout[0]
+    response = catalog.session.post(
+        url, data=encoder,
+        headers={
+            'Content-Type': encoder.content_type,
+            'User-Agent': catalog.user_agent,
+        },
+        timeout=(connect_timeout, None),
+        allow_redirects=False)
+    return ckanapi.common.reverse_apicontroller_action(
+        url, response.status_code, response.text)
+
+
 def _create_resource_dict_from_url(url, description):
-    now = datetime.datetime.now().isoformat()
+    now = _utc_now_isoformat()
 
     if (url.startswith('https://storage.cloud.google.com') or
             url.startswith('https://storage.googleapis.com')):
@@ -158,17 +277,90 @@ def _create_resource_dict_from_url(url, description):
     return resource
 
 
-def _find_license(license_string, license_url, known_licenses):
+# CKAN address -> (license list, whether it came from the disk cache), so
+# repeated calls in one process return the same list object (and so reuse the
+# tables built by _index_licenses).
+_LICENSE_LIST_CACHE = {}
 
-    # CKAN license IDs use:
-    #   - dashes instead of spaces
-    #   - all caps
-    sanitized_license_string = license_string.strip().replace(
-        ' ', '-').upper()
 
-    # CKAN license URLs are expected to have a trailing backslash
-    if not license_url.endswith('/'):
-        license_url = f'{license_url}/'
+def _cached_license_list(catalog, refresh=False):
+    """Get CKAN's license list, using a local cache when it is fresh.
+
+    The license list rarely changes, so it is cached at
+    ``~/.cache/ckan-licenses-<hash of the CKAN address>.json`` for
+    ``LICENSE_CACHE_TTL`` seconds.
+
+    Args:
+        catalog (ckanapi.RemoteCKAN): The CKAN instance to get licenses from.
+        refresh (bool): If True, ignore any cached list and fetch the list
+            from CKAN again.
+
+    Returns:
+        A tuple of ``(licenses, from_cache)``, where ``licenses`` is the list
+        of license dicts from CKAN's ``license_list`` action and
+        ``from_cache`` is True if the list was read from the disk cache
+        rather than fetched from CKAN.
+    """
+    if not refresh and catalog.address in _LICENSE_LIST_CACHE:
+        return _LICENSE_LIST_CACHE[catalog.address]
+
+    address_hash = hashlib.sha256(catalog.address.encode('utf-8')).hexdigest()
+    cache_path = os.path.join(
+        LICENSE_CACHE_DIR, f'ckan-licenses-{address_hash[:16]}.json')
+    licenses = None
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < LICENSE_CACHE_TTL:
+                with open(cache_path) as cache_file:
+                    licenses = json.load(cache_file)
+                LOGGER.debug(f"Using cached license list from {cache_path}")
+        except (OSError, ValueError):
+            pass
+    from_cache = licenses is not None
+
+    if not from_cache:
+        licenses = catalog.action.license_list()
+        temp_path = None
+        try:
+            os.makedirs(LICENSE_CACHE_DIR, exist_ok=True)
+            # Write to a temp file and move it into place so that concurrent
+            # runs never read a partially-written cache.
+            fd, temp_path = tempfile.mkstemp(
+                dir=LICENSE_CACHE_DIR, suffix='.json.tmp')
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(licenses, cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            LOGGER.debug(f"Could not write license cache {cache_path}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    _LICENSE_LIST_CACHE[catalog.address] = (licenses, from_cache)
+    return licenses, from_cache
+
+
+# (known_licenses, (url_to_licenseid, string_to_licenseid)) for the most
+# recently indexed license list.
+_LICENSE_INDEX_CACHE = (None, None)
+
+
+def _index_licenses(known_licenses):
+    """Build lookup tables from license URLs and strings to CKAN license IDs.
+
+    The tables for the most recent license list are cached, so repeated
+    lookups against the same list only build them once.
+
+    Args:
+        known_licenses (list): The license dicts returned by CKAN's
+            ``license_list`` action.
+
+    Returns:
+        A tuple of ``(url_to_licenseid, string_to_licenseid)`` dicts.
+    """
+    global _LICENSE_INDEX_CACHE
+    cached_licenses, index = _LICENSE_INDEX_CACHE
+    if cached_licenses is known_licenses:
+        return index
 
     string_to_licenseid = {}
     url_to_licenseid = {}
@@ -180,6 +372,26 @@ def _find_license(license_string, license_url, known_licenses):
             for legacy_id in license_data['legacy_ids']:
                 string_to_licenseid[legacy_id] = license_id
 
+    index = (url_to_licenseid, string_to_licenseid)
+    # Holding a reference to the list keeps its id from being reused.
+    _LICENSE_INDEX_CACHE = (known_licenses, index)
+    return index
+
+
+def _find_license(license_string, license_url, known_licenses):
+
+    # CKAN license IDs use:
+    #   - dashes instead of spaces
+    #   - all caps
+    sanitized_license_string = license_string.strip().replace(
+        ' ', '-').upper()
+
+    # CKAN license URLs are expected to have a trailing backslash
+    if not license_url.endswith('/'):
+        license_url = f'{license_url}/'
+
+    url_to_licenseid, string_to_licenseid = _index_licenses(known_licenses)
+
     # TODO do a difflib comparison for similar strings if no match found
 
     if license_url:
@@ -196,6 +408,41 @@ def _find_license(license_string, license_url, known_licenses):
                 "recognized")
 
 
+def _find_license_id(catalog, license_string, license_url):
+    """Find the CKAN license ID for a license, refreshing stale caches.
+
+    If the license is not in a cached license list, the list may predate the
+    license being added to CKAN, so the list is fetched again once before
+    giving up.
+
+    Args:
+        catalog (ckanapi.RemoteCKAN): The CKAN instance to get licenses from.
+        license_string (str): The license title.
+        license_url (str): The license URL.
+
+    Returns:
+        The CKAN license ID.
+
+    Raises:
+        ValueError: If the license is not known to CKAN.
+    """
+    licenses, from_cache = _cached_license_list(catalog)
+    LOGGER.debug(f"{len(licenses)} licenses found")
+    try:
+        return _find_license(license_string, license_url, licenses)
+    except ValueError:
+        if not from_cache:
+            raise
+        LOGGER.info("License not in cached license list; refreshing it")
+        licenses, _ = _cached_license_list(catalog, refresh=True)
+        return _find_license(license_string, license_url, licenses)
+
+
+@functools.lru_cache(maxsize=None)
+def _split_dot_keys(dot_keys):
+    return tuple(dot_keys.split('.'))
+
+
 def get_from_config(config, dot_keys):
     """Retrieve an attribute from a nested dictionary structure.
 
@@ -211,19 +458,16 @@ def get_from_config(config, dot_keys):
         value: The value of the attribute at the specified depth, or the empty
         string if the attribute indicated by ``dot_keys`` is not found.
     """
-    print("looking for", dot_keys)
-    current_mcf_value = config
-    mcf_keys = collections.deque(dot_keys.split('.'))
-    while True:
-        key = mcf_keys.popleft()
+    LOGGER.debug("looking for %s", dot_keys)
+    current_value = config
+    for key in _split_dot_keys(dot_keys):
         try:
-            current_mcf_value = current_mcf_value[key]
-            if not mcf_keys:  # we're at the root node
-                return current_mcf_value
+            current_value = current_value[key]
         except KeyError:
-            break
-    LOGGER.warning(f"Config does not contain {dot_keys}: {key} not found")
-    return ''
+            LOGGER.warning(
+                f"Config does not contain {dot_keys}: {key} not found")
+            return ''
+    return current_value
 
 
 def _create_tags_dicts(config):
@@ -231,6 +475,17 @@ def _create_tags_dicts(config):
     return [{'name': name} for name in tags_list]
 
 
+def _bbox_to_polygon(minx, miny, maxx, maxy):
+    """Build GeoJSON polygon coordinates for a bounding box.
+
+    Returns:
+        A list containing a single closed ring, starting and ending at the
+        top-left corner.
+    """
+    return [[[minx, maxy], [minx, miny], [maxx, miny], [maxx, maxy],
+             [minx, maxy]]]
+
+
 def _get_wgs84_bbox(config):
     extent = config['spatial']
     bbox = extent['bounding_box']
@@ -285,39 +540,55 @@ def _get_wgs84_bbox(config):
             f"to {dest_srs_wkt}")
         LOGGER.warning("Assuming original bounding box is in WGS84")
 
-    return [[[minx, maxy], [minx, miny], [maxx, miny], [maxx, maxy],
-             [minx, maxy]]]
+    return _bbox_to_polygon(minx, miny, maxx, maxy)
 
 
 def main(gmm_yaml_path, private=False, group=None):
     with open(gmm_yaml_path) as yaml_file:
         LOGGER.debug(f"Loading geometamaker yaml from {gmm_yaml_path}")
-        gmm_yaml = yaml.load(yaml_file.read(), Loader=yaml.Loader)
+        gmm_yaml = yaml.load(yaml_file, Loader=YAMLLoader)
 
     session = requests.Session()
     session.headers.update({'Authorization': MODIFIED_APIKEY})
+    # All CKAN calls share this session's pooled keep-alive connections.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # The CKAN lookups below run on the executor so that their latency
+    # overlaps with assembling the resources.
+    with RemoteCKAN(URL, apikey=MODIFIED_APIKEY, session=session) as catalog, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # Avoid the extra request unless its output will be seen.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "list org natcap: %s",
+                catalog.action.organization_list(id='natcap'))
 
-    with RemoteCKAN(URL, apikey=MODIFIED_APIKEY) as catalog:
-        print('list org natcap', catalog.action.organization_list(id='natcap'))
-
-        licenses = catalog.action.license_list()
-        print(f"{len(licenses)} licenses found")
-
-        license_id = ''
-        if gmm_yaml['license']:
-            license_id = _find_license(
-                gmm_yaml['license']['title'],
-                gmm_yaml['license']['path'],
-                licenses)
-
-        # does the package already exist?
         title = gmm_yaml['title']
+        description = gmm_yaml['description']
 
         # Name is uniqely identifiable on CKAN, used in the URL.
         # Example: sts-1234567890abcdef
         name = str(gmm_yaml['uid'].replace(':', '-').replace(
             'sizetimestamp', 'sts'))
 
+        # does the package already exist?
+        # package_show is used rather than a lighter package_search: a
+        # missing package is just a small NotFound response, an existing one
+        # is needed in full for its suggested_citation, and the search index
+        # can lag behind recently created (or private) packages.
+        LOGGER.info(f"Checking to see if package exists with name={name}")
+        existing_package = executor.submit(
+            catalog.action.package_show, name_or_id=name)
+
+        license_info = gmm_yaml['license']
+        if license_info:
+            # Only fetch the license list when we have a license to look up.
+            license_future = executor.submit(
+                _find_license_id, catalog, license_info['title'],
+                license_info['path'])
+
         # keys into the first contact info listing
         possible_author_keys = [
             'individual_name',
@@ -344,22 +615,23 @@ def main(gmm_yaml_path, private=False, group=None):
             raise ValueError(
                 "The YAML has neither a valid URL nor path key; "
                 "cannot create any resources.")
+        dataset_path = gmm_yaml[path_key]
         try:
             resource_dict = _create_resource_dict_from_url(
-                gmm_yaml[path_key], gmm_yaml['description'])
+                dataset_path, description)
         except NotImplementedError:
-            resource_path = gmm_yaml[path_key]
+            now = _utc_now_isoformat()
             resource_dict = {
-                'url': resource_path,
-                'description': gmm_yaml['description'],
-                'format': os.path.splitext(resource_path)[1],
+                'url': dataset_path,
+                'description': description,
+                'format': os.path.splitext(dataset_path)[1],
                 'hash': None,
-                'name': os.path.basename(resource_path),
+                'name': os.path.basename(dataset_path),
                 'size': None,
-                'created': datetime.datetime.now().isoformat(),
-                'cache_last_updated': datetime.datetime.now().isoformat(),
+                'created': now,
+                'cache_last_updated': now,
             }
-            mimetype, _ = mimetypes.guess_type(resource_path)
+            mimetype, _ = mimetypes.guess_type(dataset_path)
             if mimetype:  # will be None if mimetype unknown
                 resource_dict['mimetype'] = mimetype
         resources.append(resource_dict)
@@ -372,9 +644,10 @@ def main(gmm_yaml_path, private=False, group=None):
                 sidecar_xml, "ISO 19139 Metadata XML", upload=True))
 
         # iterate through the source items and add each as a resource.
-        for source_path in gmm_yaml['sources']:
+        sources = gmm_yaml['sources']
+        for source_path in sources:
             # Don't duplicate the resource for the main dataset
-            if gmm_yaml[path_key].endswith(source_path):
+            if dataset_path.endswith(source_path):
                 continue
 
             if os.path.basename(source_path).upper().startswith('README'):
@@ -390,9 +663,9 @@ def main(gmm_yaml_path, private=False, group=None):
 
             # Should we interpret source_path as a URL adjacent to the linked
             # dataset? If yes, figure out the URL to use.
-            if gmm_yaml[path_key].startswith('http'):
+            if dataset_path.startswith('http'):
                 filename, *parent_dirs = reversed(source_path.split('/'))
-                dataset_dirname = os.path.dirname(gmm_yaml[path_key])
+                dataset_dirname = os.path.dirname(dataset_path)
                 for directory_component in parent_dirs:
                     possible_url = f'{dataset_dirname}/{filename}'
                     if requests.head(possible_url).ok:
@@ -400,10 +673,10 @@ def main(gmm_yaml_path, private=False, group=None):
                         break
 
                 # if we couldn't find a valid URL, warn about it and skip
-                if source_path in gmm_yaml['sources']:
+                if source_path in sources:
                     warnings.warn(
                         f'The source {source_path} could not be found near '
-                        f'the dataset {gmm_yaml[path_key]}; skipping',
+                        f'the dataset {dataset_path}; skipping',
                         UserWarning)
                     continue
 
@@ -420,7 +693,7 @@ def main(gmm_yaml_path, private=False, group=None):
             if get_from_config(gmm_yaml, 'spatial.bounding_box'):
                 extras.append({
                     'key': 'spatial',
-                    'value': json.dumps({
+                    'value': _json_dumps({
                         'type': 'Polygon',
                         'coordinates': _get_wgs84_bbox(gmm_yaml),
                     }),
@@ -432,12 +705,16 @@ def main(gmm_yaml_path, private=False, group=None):
         try:
             extras.append({
                 'key': 'placenames',
-                'value': json.dumps(gmm_yaml['placenames'])
+                'value': _json_dumps(gmm_yaml['placenames'])
             })
         except KeyError:
             # KeyError: when no placenames provided.
             pass
 
+        license_id = ''
+        if license_info:
+            license_id = license_future.result()
+
         package_parameters = {
             'name': name,
             'title': title,
@@ -446,7 +723,7 @@ def main(gmm_yaml_path, private=False, group=None):
             'author_email': contact_info['email'],
             'owner_org': 'natcap',
             'type': 'dataset',
-            'notes': gmm_yaml['description'],
+            'notes': description,
             # 'url': gmm_yaml['url'],
             'version': gmm_yaml['edition'],
             'suggested_citation': gmm_yaml['citation'],
@@ -461,9 +738,7 @@ def main(gmm_yaml_path, private=False, group=None):
         }
         try:
             try:
-                LOGGER.info(
-                    f"Checking to see if package exists with name={name}")
-                pkg_dict = catalog.action.package_show(name_or_id=name)
+                pkg_dict = existing_package.result()
                 LOGGER.info(f"Package already exists name={name}")
 
                 # The suggested citation is not yet in geometamaker (see
@@ -488,7 +763,7 @@ def main(gmm_yaml_path, private=False, group=None):
                 pkg_dict = catalog.action.package_create(
                     **package_parameters
                 )
-            pprint.pprint(pkg_dict)
+            LOGGER.debug("Package: %s", pkg_dict)
 
             # Resources:
             #   * The file we're referring to (at a different URL)
@@ -498,15 +773,28 @@ def main(gmm_yaml_path, private=False, group=None):
             attached_resources = pkg_dict['resources']
             assert not attached_resources
             for resource in resources:
-                created_resource = catalog.action.resource_create(
-                    package_id=pkg_dict['id'],
-                    **resource
-                )
-                pprint.pprint(created_resource)
+                upload = resource.get('upload')
+                if upload is not None:
+                    created_resource = _upload_resource(
+                        catalog, pkg_dict['id'], resource)
+                else:
+                    created_resource = catalog.action.resource_create(
+                        package_id=pkg_dict['id'],
+                        **resource
+                    )
+                if isinstance(upload, _HashingReader):
+                    upload.close()
+                    created_resource = catalog.action.resource_patch(
+                        id=created_resource['id'],
+                        hash=f"sha256:{upload.hexdigest()}")
+                LOGGER.debug("Created resource: %s", created_resource)
 
         except AttributeError:
-            print(dir(catalog.action))
+            LOGGER.exception(
+                "CKAN action not found; available actions: %s",
+                dir(catalog.action))
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     main(sys.argv[1])
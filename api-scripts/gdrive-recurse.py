@@ -7,6 +7,7 @@ Follow authentication steps at https://developers.google.com/drive/api/quickstar
 
 """
 import importlib.util
+import logging
 import os.path
 import shutil
 import sys
@@ -123,4 +124,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
@@ -9,6 +9,11 @@ from datetime import timezone
 import ckan.plugins.toolkit as toolkit
 import yaml
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 LOGGER = logging.getLogger(__name__)
 TITILER_URL = os.environ.get('TITILER_URL',
                              'https://titiler-897938321824.us-west1.run.app')
@@ -24,8 +29,7 @@ def get_dataset_metadata(resources: list[dict]) -> dict:
     for resource in resources:
         if resource['description'] == 'Geometamaker YML':
             with urllib.request.urlopen(resource['url']) as response:
-                text = response.read()
-                return yaml.safe_load(text)
+                return yaml.load(response, Loader=YAMLLoader)
 
     return None
 
@@ -198,7 +202,7 @@ def get_vector_layer_metadata(vector_resource: dict) -> dict:
     metadata_url = vector_resource['metadata_url']
     try:
         with urllib.request.urlopen(metadata_url) as req:
-            yaml_data = yaml.safe_load(req.read())
+            yaml_data = yaml.load(req, Loader=YAMLLoader)
             bounding_box = yaml_data['spatial']['bounding_box']
             bounds = [
                 bounding_box['xmin'],